@@ -1,24 +1,243 @@
 """Flask web application for parsing KNX project files."""
 
-import json
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import multiprocessing
 import os
+import queue
 import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, send_file
+from flask.logging import default_handler
+import orjson
+from werkzeug.exceptions import HTTPException
 from werkzeug.utils import secure_filename
 
-from xknxproject import XKNXProj
+from xknxproject import XKNXProj, build_device_group_object_view
+from xknxproject.logical_devices import DeviceGroupObjectSummary
+from xknxproject.models import KNXProject
 
 # Get project root directory (where app.py is located)
-PROJECT_ROOT = Path(__file__).parent.absolute()
+PROJECT_ROOT = Path(__file__).parent.resolve()
 
 app = Flask(__name__)
 app.config["MAX_CONTENT_LENGTH"] = 50 * 1024 * 1024  # 50MB max file size
 app.config["UPLOAD_FOLDER"] = tempfile.gettempdir()
 
 ALLOWED_EXTENSIONS = {"knxproj"}
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# orjson options used for JSON files written to disk
+ORJSON_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Stat results of listed JSON files, reused for rapid successive requests
+STAT_CACHE_TTL = 2.0  # seconds
+_stat_cache: dict[str, tuple[float, os.stat_result]] = {}
+
+# ISO formatted modification times, keyed by whole seconds
+ISO_CACHE_MAX_SIZE = 4096
+_iso_cache: dict[int, str] = {}
+
+# Parsed projects of recent uploads, keyed by (file digest, password, language)
+PARSE_CACHE_SIZE = 8
+_parse_cache: OrderedDict[tuple[str, str | None, str | None], KNXProject] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+# Uploads are processed as background jobs polled via /upload-status/<job_id>.
+# The CPU-bound parsing runs in worker processes to sidestep the GIL, raw
+# project JSON files are written off the job thread.
+# Parse workers are spawned and re-import this module, so the pools and the log
+# listener are only started on first use in the serving process.
+_workers_lock = threading.Lock()
+_upload_jobs: ThreadPoolExecutor | None = None
+_raw_json_writer: ThreadPoolExecutor | None = None
+_parse_pool: ProcessPoolExecutor | None = None
+
+# Results of finished jobs which are never polled are dropped after JOB_RESULT_TTL
+JOB_RESULT_TTL = 10 * 60  # seconds
+_jobs: dict[str, Future[dict[str, object]]] = {}
+_jobs_finished_at: dict[str, float] = {}
+_jobs_lock = threading.Lock()
+
+
+class ORJSONResponse(Response):
+    """Response carrying a body already serialized by orjson."""
+
+    default_mimetype = "application/json"
+
+
+def json_response(obj: object, status: int = 200) -> ORJSONResponse:
+    """Serialize obj with orjson and return the bytes as JSON response."""
+    return ORJSONResponse(orjson.dumps(obj), status=status)
+
+
+def start_log_listener() -> None:
+    """Write app log records through Flask's default handler on a listener thread."""
+    # QueueHandler.prepare() still formats each record (including tracebacks)
+    # on the logging thread, i.e. the upload job thread
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    app.logger.removeHandler(default_handler)
+    app.logger.addHandler(QueueHandler(log_queue))
+    log_listener = QueueListener(log_queue, default_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+
+def get_upload_jobs() -> ThreadPoolExecutor:
+    """Return the thread pool processing upload jobs, starting it on first use."""
+    global _upload_jobs
+    with _workers_lock:
+        if _upload_jobs is None:
+            # app log records are emitted by the upload jobs
+            start_log_listener()
+            _upload_jobs = ThreadPoolExecutor(max_workers=os.cpu_count())
+        return _upload_jobs
+
+
+def get_raw_json_writer() -> ThreadPoolExecutor:
+    """Return the thread writing raw project JSON files, starting it on first use."""
+    global _raw_json_writer
+    with _workers_lock:
+        if _raw_json_writer is None:
+            _raw_json_writer = ThreadPoolExecutor(max_workers=1)
+        return _raw_json_writer
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """Return the pool of parse worker processes, starting it on first use."""
+    global _parse_pool
+    with _workers_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_pool
+
+
+def discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """Shut down a broken parse pool so the next upload starts a new one."""
+    global _parse_pool
+    with _workers_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def write_raw_json_file(path: Path, project: KNXProject) -> None:
+    """Serialize the complete parsed project to a JSON file."""
+    try:
+        path.write_bytes(orjson.dumps(project, option=ORJSON_FILE_OPTIONS))
+    except Exception:
+        app.logger.exception("Error saving raw JSON file %s", path)
+
+
+def file_digest(filepath: str) -> str:
+    """Return the BLAKE2b hex digest of a file, read in chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, "rb") as file:
+        while chunk := file.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_knxproj(filepath: str, password: str | None, language: str | None) -> KNXProject:
+    """Parse a .knxproj file - executed in a worker process of the parse pool."""
+    knxproj = XKNXProj(
+        path=filepath,
+        password=password,
+        language=language,
+    )
+    return knxproj.parse()
+
+
+def parse_project(filepath: str, password: str | None, language: str | None) -> KNXProject:
+    """Parse a .knxproj file, reusing the result of an identical recent upload."""
+    cache_key = (file_digest(filepath), password, language)
+    with _parse_cache_lock:
+        if (project := _parse_cache.get(cache_key)) is not None:
+            _parse_cache.move_to_end(cache_key)
+            return project
+
+    pool = get_parse_pool()
+    try:
+        project = pool.submit(parse_knxproj, filepath, password, language).result()
+    except BrokenProcessPool:
+        # A worker died (e.g. killed when running out of memory) - fail this
+        # upload but let later ones use a new pool
+        discard_parse_pool(pool)
+        raise
+
+    with _parse_cache_lock:
+        _parse_cache[cache_key] = project
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return project
+
+
+def cached_stat(
+    entry: os.DirEntry[str],
+    stat_cache: dict[str, tuple[float, os.stat_result]],
+    ttl: float = STAT_CACHE_TTL,
+) -> os.stat_result:
+    """Return stat() of a directory entry, reusing a result younger than ttl seconds."""
+    # Results of the previous listing are looked up in _stat_cache, the result
+    # used for this listing is stored in stat_cache
+    now = time.monotonic()
+    if (cached := _stat_cache.get(entry.path)) is None or now - cached[0] >= ttl:
+        cached = (now, entry.stat())
+    stat_cache[entry.path] = cached
+    return cached[1]
+
+
+def isoformat_timestamp(timestamp: float) -> str:
+    """Return the ISO format of a timestamp with seconds resolution."""
+    seconds = int(timestamp)
+    if (iso := _iso_cache.get(seconds)) is None:
+        if len(_iso_cache) >= ISO_CACHE_MAX_SIZE:
+            _iso_cache.clear()
+        iso = _iso_cache[seconds] = datetime.fromtimestamp(seconds).isoformat()
+    return iso
+
+
+def display_device(device_entry: DeviceGroupObjectSummary) -> dict[str, object]:
+    """Convert a structured device entry to the display format used by the frontend."""
+    return {
+        "id": device_entry["device_id"],
+        "name": device_entry["name"],
+        "hardware_name": device_entry["hardware_name"],
+        "individual_address": device_entry["individual_address"],
+        "manufacturer": device_entry["manufacturer"],
+        "description": device_entry["description"],
+        "group_objects": [
+            {
+                "com_obj_id": go["communication_object_id"],
+                "number": go["number"],
+                "name": go["name"],
+                "object_function": go["object_function"],
+                "linked_with": go["linked_with"],
+                # Group addresses as comma-separated string for display
+                "group_addresses": ", ".join(ga["address"] for ga in go["group_addresses"]),
+                "length": go["length"],
+                "flags": " ".join(
+                    letter for letter, is_set in go["flags"].items() if is_set
+                ) or "-",
+                "dpt": go["dpt"],
+            }
+            for go in device_entry["group_objects"]
+        ],
+    }
 
 
 def allowed_file(filename: str) -> bool:
@@ -35,22 +254,32 @@ def index():
 @app.route("/list-json-files", methods=["GET"])
 def list_json_files():
     """List all JSON files in the project root."""
+    global _stat_cache
     json_files = []
+    stat_cache: dict[str, tuple[float, os.stat_result]] = {}
     try:
-        for file in PROJECT_ROOT.glob("*.json"):
-            # Skip test files
-            if not file.name.startswith("test_"):
-                json_files.append({
-                    "name": file.name,
-                    "path": str(file),
-                    "size": file.stat().st_size,
-                    "modified": datetime.fromtimestamp(file.stat().st_mtime).isoformat(),
-                })
+        with os.scandir(PROJECT_ROOT) as entries:
+            for entry in entries:
+                # Skip test files
+                if (
+                    entry.name.endswith(".json")
+                    and not entry.name.startswith("test_")
+                    and entry.is_file()
+                ):
+                    file_stat = cached_stat(entry, stat_cache)
+                    json_files.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size": file_stat.st_size,
+                        "modified": isoformat_timestamp(file_stat.st_mtime),
+                    })
         json_files.sort(key=lambda x: x["modified"], reverse=True)
+        # Only keep stat results of files which still exist
+        _stat_cache = stat_cache
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
     
-    return jsonify({
+    return json_response({
         "project_root": str(PROJECT_ROOT),
         "files": json_files,
         "count": len(json_files),
@@ -60,127 +289,164 @@ def list_json_files():
 @app.route("/view-json/<filename>", methods=["GET"])
 def view_json_file(filename: str):
     """View a specific JSON file."""
-    # Security: only allow filenames that exist and are in project root
-    json_filepath = PROJECT_ROOT / filename
-    if not json_filepath.exists() or not str(json_filepath).startswith(str(PROJECT_ROOT)):
-        return jsonify({"error": "File not found"}), 404
+    # Security: only serve existing JSON files located directly in project root
+    json_filepath = (PROJECT_ROOT / filename).resolve()
+    if (
+        json_filepath.parent != PROJECT_ROOT
+        or json_filepath.suffix != ".json"
+        or not json_filepath.is_file()
+    ):
+        return json_response({"error": "File not found"}, 404)
     
-    try:
-        with open(json_filepath, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
-        return jsonify(json_data)
-    except Exception as e:
-        return jsonify({"error": f"Error reading file: {str(e)}"}), 500
+    # Stream the file from disk instead of loading and re-serializing it
+    return send_file(json_filepath, mimetype="application/json")
 
 
 @app.route("/upload", methods=["POST"])
 def upload_file():
     """Handle file upload and parsing."""
     if "file" not in request.files:
-        return jsonify({"error": "No file provided"}), 400
+        return json_response({"error": "No file provided"}, 400)
 
     file = request.files["file"]
     password = request.form.get("password", "").strip() or None
     language = request.form.get("language", "").strip() or None
+    save_raw = request.form.get("save_raw") == "1"
 
     if file.filename == "":
-        return jsonify({"error": "No file selected"}), 400
+        return json_response({"error": "No file selected"}, 400)
 
     if not allowed_file(file.filename):
-        return jsonify({"error": "Invalid file type. Please upload a .knxproj file"}), 400
+        return json_response({"error": "Invalid file type. Please upload a .knxproj file"}, 400)
 
-    # Save uploaded file temporarily
+    # Save uploaded file temporarily under a random name - the sanitized
+    # original filename is only used to name the JSON output files
     filename = secure_filename(file.filename)
-    filepath = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-    
+    filepath = os.path.join(app.config["UPLOAD_FOLDER"], f"upload_{uuid.uuid4().hex}.knxproj")
     try:
         file.save(filepath)
+    except Exception as e:
+        # Clean up a partially written file
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        return json_response({"error": f"Error saving file: {str(e)}"}, 500)
+
+    return submit_upload_job(filepath, filename, password, language, save_raw)
+
+
+@app.route("/upload-stream", methods=["POST"])
+def upload_file_stream():
+    """Handle a raw .knxproj request body without multipart parsing."""
+    # The client sends the file as `application/octet-stream` body and passes
+    # `filename`, `language` and `save_raw` as query parameters. The password is
+    # sent as `X-Project-Password` header to keep it out of request logs.
+    filename = secure_filename(request.args.get("filename", ""))
+    password = request.headers.get("X-Project-Password", "").strip() or None
+    language = request.args.get("language", "").strip() or None
+    save_raw = request.args.get("save_raw") == "1"
+
+    if filename == "":
+        return json_response({"error": "No filename provided"}, 400)
+
+    if not allowed_file(filename):
+        return json_response({"error": "Invalid file type. Please upload a .knxproj file"}, 400)
+
+    # Stream the request body to disk in chunks
+    with tempfile.NamedTemporaryFile(
+        dir=app.config["UPLOAD_FOLDER"], suffix=".knxproj", delete=False
+    ) as tmp:
+        filepath = tmp.name
+        try:
+            while chunk := request.stream.read(UPLOAD_CHUNK_SIZE):
+                tmp.write(chunk)
+        except (HTTPException, OSError) as e:
+            tmp.close()
+            os.remove(filepath)
+            if isinstance(e, HTTPException):
+                # e.g. RequestEntityTooLarge keeps its 413 status code
+                return json_response({"error": e.description}, e.code or 400)
+            return json_response({"error": f"Error receiving file: {str(e)}"}, 400)
+
+    return submit_upload_job(filepath, filename, password, language, save_raw)
+
+
+@app.route("/upload-status/<job_id>", methods=["GET"])
+def upload_status(job_id: str):
+    """Return the result of an upload job, or 202 while it is still running."""
+    with _jobs_lock:
+        prune_finished_jobs()
+        if (job := _jobs.get(job_id)) is None:
+            return json_response({"error": "Unknown job"}, 404)
+        # checked once, a job finishing right now must not be left in _jobs
+        if done := job.done():
+            # only one of concurrent polls receives the result
+            _jobs.pop(job_id, None)
+            _jobs_finished_at.pop(job_id, None)
+
+    if not done:
+        return json_response({"job_id": job_id, "status": "running"}, 202)
+
+    if (error := job.exception()) is not None:
+        return json_response({"error": f"Error parsing file: {str(error)}"}, 500)
+    return json_response(job.result())
+
+
+def submit_upload_job(
+    filepath: str,
+    filename: str,
+    password: str | None,
+    language: str | None,
+    save_raw: bool = False,
+):
+    """Process a saved .knxproj file in the background and return its job id."""
+    job_id = uuid.uuid4().hex
+    job = get_upload_jobs().submit(
+        process_upload, filepath, filename, password, language, save_raw
+    )
+    with _jobs_lock:
+        prune_finished_jobs()
+        _jobs[job_id] = job
+    job.add_done_callback(lambda _: mark_job_finished(job_id))
+    return json_response(
+        {"job_id": job_id, "status_url": f"/upload-status/{job_id}"}, 202
+    )
 
+
+def mark_job_finished(job_id: str) -> None:
+    """Record when a job finished, to expire its result if it is never polled."""
+    with _jobs_lock:
+        if job_id in _jobs:
+            _jobs_finished_at[job_id] = time.monotonic()
+
+
+def prune_finished_jobs() -> None:
+    """Drop finished jobs older than JOB_RESULT_TTL - call with _jobs_lock held."""
+    expired = time.monotonic() - JOB_RESULT_TTL
+    for job_id in [
+        job_id for job_id, finished_at in _jobs_finished_at.items() if finished_at < expired
+    ]:
+        del _jobs_finished_at[job_id]
+        del _jobs[job_id]
+
+
+def process_upload(
+    filepath: str,
+    filename: str,
+    password: str | None,
+    language: str | None,
+    save_raw: bool = False,
+) -> dict[str, object]:
+    """Parse a saved .knxproj file, store the JSON output and build the response data."""
+    try:
         # Parse the KNX project
-        knxproj = XKNXProj(
-            path=filepath,
-            password=password,
-            language=language,
-        )
-        project = knxproj.parse()
+        project = parse_project(filepath, password, language)
 
         # Build structured JSON with devices and their group addresses (like ETS6 view)
-        structured_devices = []
-        for device_id, device in project["devices"].items():
-            device_group_objects = []
-            
-            # Process each communication object for this device
-            for com_obj_id in device["communication_object_ids"]:
-                if com_obj_id not in project["communication_objects"]:
-                    continue
-                    
-                com_obj = project["communication_objects"][com_obj_id]
-                
-                # Verify this communication object belongs to this device
-                if com_obj["device_address"] != device["individual_address"]:
-                    continue
-                
-                # Get full group address details for each linked group address
-                group_addresses_full = []
-                for ga_address in com_obj["group_address_links"]:
-                    if ga_address in project["group_addresses"]:
-                        ga = project["group_addresses"][ga_address]
-                        group_addresses_full.append({
-                            "address": ga["address"],
-                            "name": ga.get("name", ""),
-                            "dpt": ga.get("dpt"),
-                            "description": ga.get("description", ""),
-                            "comment": ga.get("comment", ""),
-                        })
-                
-                # Build flags (C, R, W, T, U)
-                flags = {
-                    "C": com_obj["flags"]["communication"],
-                    "R": com_obj["flags"]["read"],
-                    "W": com_obj["flags"]["write"],
-                    "T": com_obj["flags"].get("transmit", False),
-                    "U": com_obj["flags"].get("update", False),
-                }
-                
-                # Get DPT type description
-                dpt_type = None
-                if com_obj.get("dpts") and len(com_obj["dpts"]) > 0:
-                    dpt = com_obj["dpts"][0]
-                    dpt_type = f"{dpt['main']}.{dpt['sub']}" if dpt.get('sub') else str(dpt['main'])
-                
-                # Create group object entry (like ETS6 table row)
-                group_object = {
-                    "number": com_obj["number"],
-                    "name": com_obj.get("name") or com_obj.get("text") or f"Object {com_obj['number']}",
-                    "object_function": com_obj.get("function_text") or com_obj.get("text") or "",
-                    "linked_with": com_obj.get("description") or com_obj.get("function_text") or com_obj.get("text") or "",
-                    "group_addresses": group_addresses_full,  # Full group address details
-                    "length": com_obj.get("object_size", ""),
-                    "flags": flags,
-                    "dpt": dpt_type,
-                    "communication_object_id": com_obj_id,
-                }
-                device_group_objects.append(group_object)
-            
-            # Sort by communication object number
-            device_group_objects.sort(key=lambda x: x["number"])
-            
-            # Create device entry with all its group objects
-            device_entry = {
-                "device_id": device_id,
-                "name": device.get("name") or device.get("hardware_name") or "Unnamed Device",
-                "hardware_name": device.get("hardware_name", ""),
-                "individual_address": device["individual_address"],
-                "manufacturer": device.get("manufacturer_name", ""),
-                "description": device.get("description", ""),
-                "group_objects": device_group_objects,  # All group objects with group addresses
-                "total_group_objects": len(device_group_objects),
-            }
-            structured_devices.append(device_entry)
-        
-        # Sort devices by individual address
-        structured_devices.sort(key=lambda x: x["individual_address"])
-        
+        structured_devices = build_device_group_object_view(project)
+
+        # Convert structured devices to display format used by the frontend
+        devices_data = [display_device(device_entry) for device_entry in structured_devices]
+
         # Create the structured JSON output
         structured_output = {
             "project_info": project["info"],
@@ -207,86 +473,30 @@ def upload_file():
         
         try:
             # Save structured JSON
-            with open(structured_json_filepath, "w", encoding="utf-8") as json_file:
-                json.dump(structured_output, json_file, indent=2, ensure_ascii=False)
+            structured_json_filepath.write_bytes(
+                orjson.dumps(structured_output, option=ORJSON_FILE_OPTIONS)
+            )
             # Verify file was created
             if not structured_json_filepath.exists():
                 raise IOError(f"Failed to create structured JSON file at {structured_json_filepath}")
             json_filename = structured_json_filename
-        except Exception as json_error:
+        except Exception:
             # Log error but don't fail the request
-            print(f"Error saving structured JSON file: {json_error}")
+            app.logger.exception(
+                "Error saving structured JSON file %s", structured_json_filepath
+            )
         
-        try:
-            # Save raw JSON (complete parsed project)
-            with open(raw_json_filepath, "w", encoding="utf-8") as json_file:
-                json.dump(project, json_file, indent=2, ensure_ascii=False)
-            # Verify file was created
-            if not raw_json_filepath.exists():
-                raise IOError(f"Failed to create raw JSON file at {raw_json_filepath}")
+        if save_raw:
+            # Save raw JSON (complete parsed project) in the background
+            get_raw_json_writer().submit(write_raw_json_file, raw_json_filepath, project)
             raw_json_filename_saved = raw_json_filename
-        except Exception as json_error:
-            # Log error but don't fail the request
-            print(f"Error saving raw JSON file: {json_error}")
-        
-        # Clean up temporary file
-        os.remove(filepath)
-
-        # Use the structured output for the web display as well
-        # Convert structured devices to display format (for backward compatibility with frontend)
-        devices_data = []
-        for device_entry in structured_devices:
-            device_info = {
-                "id": device_entry["device_id"],
-                "name": device_entry["name"],
-                "hardware_name": device_entry["hardware_name"],
-                "individual_address": device_entry["individual_address"],
-                "manufacturer": device_entry["manufacturer"],
-                "description": device_entry["description"],
-                "group_objects": [],
-            }
-            
-            # Convert group objects to display format
-            for go in device_entry["group_objects"]:
-                # Format group addresses as comma-separated string for display
-                ga_addresses_str = ", ".join([ga["address"] for ga in go["group_addresses"]]) if go["group_addresses"] else ""
-                
-                # Format flags as string
-                flags_list = []
-                if go["flags"]["C"]:
-                    flags_list.append("C")
-                if go["flags"]["R"]:
-                    flags_list.append("R")
-                if go["flags"]["W"]:
-                    flags_list.append("W")
-                if go["flags"]["T"]:
-                    flags_list.append("T")
-                if go["flags"]["U"]:
-                    flags_list.append("U")
-                flags_str = " ".join(flags_list) if flags_list else "-"
-                
-                obj_info = {
-                    "com_obj_id": go["communication_object_id"],
-                    "number": go["number"],
-                    "name": go["name"],
-                    "object_function": go["object_function"],
-                    "linked_with": go["linked_with"],
-                    "group_addresses": ga_addresses_str,
-                    "length": go["length"],
-                    "flags": flags_str,
-                    "dpt": go["dpt"],
-                }
-                device_info["group_objects"].append(obj_info)
-            
-            devices_data.append(device_info)
-
-        response_data = {
+
+        response_data: dict[str, object] = {
             "success": True,
             "project_info": structured_output["project_info"],
             "devices": devices_data,
             "total_devices": structured_output["total_devices"],
             "total_group_addresses": structured_output["total_group_addresses"],
-            "full_json": structured_output,  # Include the structured JSON output
         }
         
         if json_filename:
@@ -297,13 +507,12 @@ def upload_file():
             response_data["raw_json_file_saved"] = raw_json_filename_saved
             response_data["raw_json_file_path"] = str(raw_json_filepath)
         
-        return jsonify(response_data)
+        return response_data
 
-    except Exception as e:
-        # Clean up file if it still exists
+    finally:
+        # Clean up temporary file
         if os.path.exists(filepath):
             os.remove(filepath)
-        return jsonify({"error": f"Error parsing file: {str(e)}"}), 500
 
 
 if __name__ == "__main__":
@@ -4,15 +4,23 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import orjson
 import pytest
 
 from test import STUBS_PATH
-from xknxproject.logical_devices import build_logical_device_view, export_logical_devices
+from xknxproject import logical_devices
+from xknxproject.logical_devices import (
+    _individual_address_sort_key,
+    build_device_group_object_view,
+    build_logical_device_view,
+    export_logical_devices,
+    main,
+)
 
 
 @pytest.fixture()
 def stub_project() -> dict:
-    return json.loads((STUBS_PATH / "xknx_test_project.json").read_text(encoding="utf-8"))
+    return orjson.loads((STUBS_PATH / "xknx_test_project.json").read_bytes())
 
 
 def test_build_logical_device_view_collects_group_addresses(stub_project: dict) -> None:
@@ -37,6 +45,56 @@ def test_build_logical_device_view_collects_group_addresses(stub_project: dict)
     assert "Ausgang B" in communication_object_names
 
 
+def test_build_device_group_object_view_lists_group_objects(stub_project: dict) -> None:
+    devices = build_device_group_object_view(stub_project)
+
+    assert [device["individual_address"] for device in devices] == sorted(
+        stub_project["devices"],
+        key=lambda address: tuple(int(part) for part in address.split(".")),
+    )
+    device = next(entry for entry in devices if entry["individual_address"] == "1.1.5")
+    assert device["total_group_objects"] == len(device["group_objects"])
+
+    numbers = [group_object["number"] for group_object in device["group_objects"]]
+    assert numbers == sorted(numbers)
+
+    group_object = next(go for go in device["group_objects"] if go["number"] == 40)
+    assert group_object["name"] == "Ausgang B"
+    assert group_object["dpt"] == "1"
+    assert group_object["flags"] == {
+        "C": True,
+        "R": False,
+        "W": True,
+        "T": False,
+        "U": False,
+    }
+    assert group_object["group_addresses"] == [
+        {
+            "address": "1/0/5",
+            "name": stub_project["group_addresses"]["1/0/5"]["name"],
+            "dpt": {"main": 1, "sub": None},
+            "description": stub_project["group_addresses"]["1/0/5"]["description"],
+            "comment": stub_project["group_addresses"]["1/0/5"]["comment"],
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    ("individual_address", "expected"),
+    [
+        ("1.1.5", (1, 1, 5)),
+        ("15.15.255", (15, 15, 255)),
+        ("1.1", (0, 0, 0)),
+        ("1.1.x", (0, 0, 0)),
+        ("", (0, 0, 0)),
+    ],
+)
+def test_individual_address_sort_key(
+    individual_address: str, expected: tuple[int, int, int]
+) -> None:
+    assert _individual_address_sort_key(individual_address) == expected
+
+
 def test_export_logical_devices_writes_expected_file(
     stub_project: dict, tmp_path: Path
 ) -> None:
@@ -59,3 +117,96 @@ def test_export_logical_devices_writes_expected_file(
         for group in device["group_addresses"]
         for link in group["communication_objects"]
     )
+
+
+def test_export_logical_devices_without_speedups(
+    stub_project: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(logical_devices, "_HAS_IJSON", False)
+    monkeypatch.setattr(logical_devices, "_HAS_ORJSON", False)
+    input_path = tmp_path / "project.json"
+    input_path.write_text(json.dumps(stub_project), encoding="utf-8")
+
+    output_path = export_logical_devices(input_path=input_path)
+
+    assert output_path == tmp_path / "project_logical_devices.json"
+    payload = json.loads(output_path.read_text(encoding="utf-8"))
+    assert payload["project"] == stub_project["info"]
+    assert payload["devices"] == json.loads(
+        json.dumps(build_logical_device_view(stub_project))
+    )
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_export_logical_devices_loaders(
+    stub_project: dict,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    stream: bool,
+) -> None:
+    loaded: list[bytes] = []
+    orjson_loads = orjson.loads
+
+    def spy_loads(data: bytes) -> object:
+        loaded.append(data)
+        return orjson_loads(data)
+
+    monkeypatch.setattr(orjson, "loads", spy_loads)
+    input_path = tmp_path / "project.json"
+    input_path.write_text(json.dumps(stub_project), encoding="utf-8")
+
+    output_path = export_logical_devices(input_path=input_path, stream=stream)
+
+    # orjson is preferred, ijson is only used when streaming is requested
+    assert len(loaded) == (0 if stream else 1)
+    payload = json.loads(output_path.read_text(encoding="utf-8"))
+    assert payload["project"] == stub_project["info"]
+    assert payload["devices"] == json.loads(
+        json.dumps(build_logical_device_view(stub_project))
+    )
+
+
+@pytest.mark.parametrize("speedups", [True, False])
+def test_export_logical_devices_indent(
+    stub_project: dict,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    speedups: bool,
+) -> None:
+    monkeypatch.setattr(logical_devices, "_HAS_ORJSON", speedups)
+    input_path = tmp_path / "project.json"
+    input_path.write_text(json.dumps(stub_project), encoding="utf-8")
+
+    compact = export_logical_devices(input_path, tmp_path / "compact.json")
+    pretty = export_logical_devices(input_path, tmp_path / "pretty.json", indent=2)
+
+    assert b"\n" not in compact.read_bytes()
+    assert pretty.read_text(encoding="utf-8").startswith('{\n  "project": {')
+    assert json.loads(compact.read_bytes()) == json.loads(pretty.read_bytes())
+
+
+@pytest.mark.parametrize(
+    ("argv", "pretty"),
+    [
+        (["{input}", "-o", "{output}"], False),
+        (["--pretty", "{input}", "--output", "{output}"], True),
+        (["{input}", "--output={output}", "--pretty"], True),
+    ],
+)
+def test_main_writes_export(
+    stub_project: dict, tmp_path: Path, argv: list[str], pretty: bool
+) -> None:
+    input_path = tmp_path / "project.json"
+    input_path.write_text(json.dumps(stub_project), encoding="utf-8")
+    output_path = tmp_path / "export.json"
+
+    assert (
+        main([arg.format(input=input_path, output=output_path) for arg in argv]) == 0
+    )
+    assert (b"\n" in output_path.read_bytes()) is pretty
+
+
+def test_main_help_uses_argparse(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit):
+        main(["--help"])
+    assert "--pretty" in capsys.readouterr().out
@@ -1,7 +1,16 @@
 """ETS Project Parser is a library to parse ETS project files."""
 
 # flake8: noqa
-from .logical_devices import build_logical_device_view, export_logical_devices
+from .logical_devices import (
+    build_device_group_object_view,
+    build_logical_device_view,
+    export_logical_devices,
+)
 from .xknxproj import XKNXProj
 
-__all__ = ["build_logical_device_view", "export_logical_devices", "XKNXProj"]
+__all__ = [
+    "build_device_group_object_view",
+    "build_logical_device_view",
+    "export_logical_devices",
+    "XKNXProj",
+]
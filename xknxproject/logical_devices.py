@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
-import argparse
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
 import json
+from operator import itemgetter
 from pathlib import Path
+import sys
 from typing import TypedDict
 
 from xknxproject.models import CommunicationObject, Device, DPTType, GroupAddress, KNXProject
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
+
+try:
+    import ijson.backends.yajl2_c as ijson
+
+    _HAS_IJSON = True
+except ImportError:  # pragma: no cover - ijson is an optional dependency
+    _HAS_IJSON = False
+
+# top level keys of a project dump used for the logical device export
+_EXPORT_PROJECT_KEYS = frozenset(
+    {"info", "devices", "communication_objects", "group_addresses"}
+)
+
 
 class CommunicationObjectLink(TypedDict):
     """A simplified representation of a communication object for export."""
@@ -48,40 +71,140 @@ class LogicalDeviceSummary(TypedDict):
     group_addresses: list[LogicalDeviceGroupAddress]
 
 
+class GroupObjectGroupAddress(TypedDict):
+    """Group address linked to a group object of a device."""
+
+    address: str
+    name: str
+    dpt: DPTType | None
+    description: str
+    comment: str
+
+
+class GroupObjectFlags(TypedDict):
+    """Communication, read, write, transmit and update flags of a group object."""
+
+    C: bool
+    R: bool
+    W: bool
+    T: bool
+    U: bool
+
+
+class DeviceGroupObject(TypedDict):
+    """A group object row as shown in the ETS device view."""
+
+    number: int
+    name: str
+    object_function: str
+    linked_with: str
+    group_addresses: list[GroupObjectGroupAddress]
+    length: str
+    flags: GroupObjectFlags
+    dpt: str | None
+    communication_object_id: str
+
+
+class DeviceGroupObjectSummary(TypedDict):
+    """Device paired with all its group objects."""
+
+    device_id: str
+    name: str
+    hardware_name: str
+    individual_address: str
+    manufacturer: str
+    description: str
+    group_objects: list[DeviceGroupObject]
+    total_group_objects: int
+
+
 def build_logical_device_view(project: KNXProject) -> list[LogicalDeviceSummary]:
     """Return a list of logical devices with their linked group addresses."""
 
     communication_objects = project["communication_objects"]
     group_addresses = project["group_addresses"]
 
-    logical_devices: list[LogicalDeviceSummary] = []
-    for individual_address, device in sorted(
-        project["devices"].items(), key=lambda item: _individual_address_sort_key(item[0])
+    keyed_devices = [
+        (individual_address, device, _individual_address_sort_key(individual_address))
+        for individual_address, device in project["devices"].items()
+    ]
+    keyed_devices.sort(key=itemgetter(2))
+
+    return [
+        {
+            "individual_address": individual_address,
+            "name": device["name"],
+            "hardware_name": device["hardware_name"],
+            "manufacturer_name": device["manufacturer_name"],
+            "order_number": device["order_number"],
+            "application": device["application"],
+            "group_addresses": _collect_group_addresses(
+                device=device,
+                communication_objects=communication_objects,
+                group_addresses=group_addresses,
+            ),
+        }
+        for individual_address, device, _ in keyed_devices
+    ]
+
+
+def build_device_group_object_view(
+    project: KNXProject,
+) -> list[DeviceGroupObjectSummary]:
+    """Return a list of devices with their group objects (like the ETS device view)."""
+
+    group_addresses = project["group_addresses"]
+
+    # sorting once by number keeps each device's list in group object order
+    com_objects_by_device: defaultdict[str, list[tuple[str, CommunicationObject]]] = (
+        defaultdict(list)
+    )
+    for com_obj_id, com_obj in sorted(
+        project["communication_objects"].items(), key=lambda item: item[1]["number"]
     ):
-        grouped_addresses = _collect_group_addresses(
-            device=device,
-            communication_objects=communication_objects,
-            group_addresses=group_addresses,
-        )
-        logical_devices.append(
-            LogicalDeviceSummary(
-                individual_address=individual_address,
-                name=device["name"],
-                hardware_name=device["hardware_name"],
-                manufacturer_name=device["manufacturer_name"],
-                order_number=device["order_number"],
-                application=device["application"],
-                group_addresses=grouped_addresses,
+        com_objects_by_device[com_obj["device_address"]].append((com_obj_id, com_obj))
+
+    devices: list[DeviceGroupObjectSummary] = []
+    for device_id, device in sorted(
+        project["devices"].items(),
+        key=lambda item: _individual_address_sort_key(item[1]["individual_address"]),
+    ):
+        group_objects = [
+            _build_device_group_object(
+                com_obj_id=com_obj_id,
+                com_obj=com_obj,
+                group_addresses=group_addresses,
+            )
+            for com_obj_id, com_obj in com_objects_by_device.get(
+                device["individual_address"], ()
             )
+        ]
+        devices.append(
+            {
+                "device_id": device_id,
+                "name": device["name"] or device["hardware_name"] or "Unnamed Device",
+                "hardware_name": device["hardware_name"],
+                "individual_address": device["individual_address"],
+                "manufacturer": device["manufacturer_name"],
+                "description": device["description"],
+                "group_objects": group_objects,
+                "total_group_objects": len(group_objects),
+            }
         )
 
-    return logical_devices
+    return devices
 
 
-def export_logical_devices(input_path: Path, output_path: Path | None = None) -> Path:
+def export_logical_devices(
+    input_path: Path,
+    output_path: Path | None = None,
+    *,
+    indent: int | None = None,
+    stream: bool = False,
+) -> Path:
     """Generate a logical device export JSON file from a KNX project JSON dump."""
 
-    project: KNXProject = json.loads(input_path.read_text(encoding="utf-8"))
+    project: KNXProject = _load_json(input_path, stream=stream)
     logical_devices = build_logical_device_view(project)
     payload = {
         "project": project.get("info", {}),
@@ -91,12 +214,47 @@ def export_logical_devices(input_path: Path, output_path: Path | None = None) ->
     final_output = output_path or input_path.with_name(
         f"{input_path.stem}_logical_devices.json"
     )
-    final_output.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    _dump_json(payload, final_output, indent=indent)
     return final_output
 
 
+def _load_json(path: Path, *, stream: bool = False) -> KNXProject:
+    project: KNXProject
+    if stream and _HAS_IJSON:
+        # stream the dump and only keep the subtrees needed for the export -
+        # slower than orjson, but never holds the whole document in memory
+        with path.open("rb") as file:
+            project = {  # type: ignore[assignment]
+                key: value
+                for key, value in ijson.kvitems(file, "", use_float=True)
+                if key in _EXPORT_PROJECT_KEYS
+            }
+    elif _HAS_ORJSON:
+        project = orjson.loads(path.read_bytes())
+    else:
+        project = json.loads(path.read_text(encoding="utf-8"))
+    return project
+
+
+def _dump_json(payload: object, path: Path, *, indent: int | None = None) -> None:
+    # orjson only supports an indentation of two spaces
+    if _HAS_ORJSON and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        path.write_bytes(orjson.dumps(payload, option=option))
+        return
+
+    with path.open("w", encoding="utf-8") as file:
+        json.dump(
+            payload,
+            file,
+            indent=indent,
+            separators=None if indent else (",", ":"),
+            ensure_ascii=False,
+        )
+
+
 def _collect_group_addresses(
     *,
     device: Device,
@@ -104,122 +262,189 @@ def _collect_group_addresses(
     group_addresses: dict[str, GroupAddress],
 ) -> list[LogicalDeviceGroupAddress]:
     device_comm_object_ids = _gather_comm_object_ids(device)
+    channel_names: dict[str | None, str] = {
+        channel_id: channel["name"]
+        for channel_id, channel in device["channels"].items()
+    }
     grouped_addresses: dict[str, LogicalDeviceGroupAddress] = {}
-    processed_links: set[tuple[str, str]] = set()
+    # sort keys recorded on first sight so sorting needs no further lookups
+    sort_keys: dict[str, int | str] = {}
 
     for comm_object_id in device_comm_object_ids:
         if (comm_object := communication_objects.get(comm_object_id)) is None:
             continue
 
-        channel_name = _channel_name(device, comm_object.get("channel"))
-        for group_address in comm_object["group_address_links"]:
-            if (group_address, comm_object_id) in processed_links:
-                continue
-            processed_links.add((group_address, comm_object_id))
-
-            group_entry = grouped_addresses.setdefault(
-                group_address,
-                _build_group_address_entry(
-                    group_address=group_address,
-                    group_address_data=group_addresses.get(group_address),
-                ),
-            )
+        channel_name = channel_names.get(comm_object.get("channel"))
+        # comm object ids are unique, so a link can only repeat within one object
+        for group_address in dict.fromkeys(comm_object["group_address_links"]):
+            if (group_entry := grouped_addresses.get(group_address)) is None:
+                if (gad := group_addresses.get(group_address)) is not None:
+                    group_entry = {
+                        "address": gad["address"],
+                        "name": gad["name"],
+                        "project_uid": gad["project_uid"],
+                        "dpt": gad["dpt"],
+                        "data_secure": gad["data_secure"],
+                        "description": gad["description"],
+                        "comment": gad["comment"],
+                        "communication_objects": [],
+                    }
+                    sort_keys[group_address] = gad["raw_address"]
+                else:
+                    group_entry = {
+                        "address": group_address,
+                        "name": "",
+                        "project_uid": None,
+                        "dpt": None,
+                        "data_secure": False,
+                        "description": "",
+                        "comment": "",
+                        "communication_objects": [],
+                    }
+                    sort_keys[group_address] = group_address
+                grouped_addresses[group_address] = group_entry
+
             group_entry["communication_objects"].append(
-                _summarize_comm_object(
-                    comm_object_id=comm_object_id,
-                    comm_object=comm_object,
-                    channel_name=channel_name,
-                )
+                {
+                    "id": comm_object_id,
+                    "name": comm_object["name"],
+                    "number": comm_object["number"],
+                    "text": comm_object["text"],
+                    "function_text": comm_object["function_text"],
+                    "description": comm_object["description"],
+                    "channel": comm_object.get("channel"),
+                    "channel_name": channel_name,
+                }
             )
 
-    sorted_groups = _sort_group_addresses(grouped_addresses, group_addresses)
+    sorted_groups = _sort_group_addresses(grouped_addresses, sort_keys)
     for group in sorted_groups:
-        group["communication_objects"].sort(key=lambda co: (co["number"], co["id"]))
+        group["communication_objects"].sort(key=itemgetter("number", "id"))
     return sorted_groups
 
 
-def _gather_comm_object_ids(device: Device) -> set[str]:
-    comm_object_ids = set(device["communication_object_ids"])
-    for channel in device["channels"].values():
-        comm_object_ids.update(channel["communication_object_ids"])
-    return comm_object_ids
+def _build_device_group_object(
+    *,
+    com_obj_id: str,
+    com_obj: CommunicationObject,
+    group_addresses: dict[str, GroupAddress],
+) -> DeviceGroupObject:
+    dpt_type = None
+    if dpts := com_obj["dpts"]:
+        dpt = dpts[0]
+        dpt_type = f"{dpt['main']}.{dpt['sub']}" if dpt["sub"] else str(dpt["main"])
+
+    flags = com_obj["flags"]
+    text = com_obj["text"]
+    function_text = com_obj["function_text"] or text
+    return {
+        "number": com_obj["number"],
+        "name": com_obj["name"] or text or f"Object {com_obj['number']}",
+        "object_function": function_text or "",
+        "linked_with": com_obj["description"] or function_text or "",
+        "group_addresses": [
+            {
+                "address": group_address["address"],
+                "name": group_address["name"],
+                "dpt": group_address["dpt"],
+                "description": group_address["description"],
+                "comment": group_address["comment"],
+            }
+            for address in com_obj["group_address_links"]
+            if (group_address := group_addresses.get(address)) is not None
+        ],
+        "length": com_obj["object_size"],
+        "flags": {
+            "C": flags["communication"],
+            "R": flags["read"],
+            "W": flags["write"],
+            "T": flags["transmit"],
+            "U": flags["update"],
+        },
+        "dpt": dpt_type,
+        "communication_object_id": com_obj_id,
+    }
 
 
-def _channel_name(device: Device, channel_id: str | None) -> str | None:
-    if channel_id is None:
-        return None
-    if channel := device["channels"].get(channel_id):
-        return channel["name"]
-    return None
-
-
-def _build_group_address_entry(
-    *, group_address: str, group_address_data: GroupAddress | None
-) -> LogicalDeviceGroupAddress:
-    if group_address_data is not None:
-        return LogicalDeviceGroupAddress(
-            address=group_address_data["address"],
-            name=group_address_data["name"],
-            project_uid=group_address_data["project_uid"],
-            dpt=group_address_data["dpt"],
-            data_secure=group_address_data["data_secure"],
-            description=group_address_data["description"],
-            comment=group_address_data["comment"],
-            communication_objects=[],
+def _gather_comm_object_ids(device: Device) -> dict[str, None]:
+    # dict keys deduplicate while keeping the project's comm object order
+    return dict.fromkeys(
+        chain(
+            device["communication_object_ids"],
+            *(
+                channel["communication_object_ids"]
+                for channel in device["channels"].values()
+            ),
         )
-
-    return LogicalDeviceGroupAddress(
-        address=group_address,
-        name="",
-        project_uid=None,
-        dpt=None,
-        data_secure=False,
-        description="",
-        comment="",
-        communication_objects=[],
-    )
-
-
-def _summarize_comm_object(
-    *,
-    comm_object_id: str,
-    comm_object: CommunicationObject,
-    channel_name: str | None,
-) -> CommunicationObjectLink:
-    return CommunicationObjectLink(
-        id=comm_object_id,
-        name=comm_object["name"],
-        number=comm_object["number"],
-        text=comm_object["text"],
-        function_text=comm_object["function_text"],
-        description=comm_object["description"],
-        channel=comm_object.get("channel"),
-        channel_name=channel_name,
     )
 
 
 def _sort_group_addresses(
     grouped_addresses: dict[str, LogicalDeviceGroupAddress],
-    group_addresses: dict[str, GroupAddress],
+    sort_keys: dict[str, int | str],
 ) -> list[LogicalDeviceGroupAddress]:
-    def sort_key(entry: LogicalDeviceGroupAddress) -> int | str:
-        if (group_address := group_addresses.get(entry["address"])) is not None:
-            return group_address["raw_address"]
-        return entry["address"]
-
-    return sorted(grouped_addresses.values(), key=sort_key)
+    keyed_groups: list[tuple[int | str, LogicalDeviceGroupAddress]] = [
+        (sort_keys[address], entry) for address, entry in grouped_addresses.items()
+    ]
+    keyed_groups.sort(key=itemgetter(0))
+    return [entry for _, entry in keyed_groups]
 
 
+@lru_cache(maxsize=4096)
 def _individual_address_sort_key(individual_address: str) -> tuple[int, int, int]:
-    try:
-        return tuple(int(part) for part in individual_address.split("."))  # type: ignore[return-value]
-    except ValueError:
-        return (0, 0, 0)
+    parts = individual_address.split(".")
+    if (
+        len(parts) == 3
+        and parts[0].isdecimal()
+        and parts[1].isdecimal()
+        and parts[2].isdecimal()
+    ):
+        return (int(parts[0]), int(parts[1]), int(parts[2]))
+    return (0, 0, 0)
 
 
 def main(argv: list[str] | None = None) -> int:
     """CLI entrypoint to export logical devices with their group addresses."""
 
+    if argv is None:
+        argv = sys.argv[1:]
+    # plain invocations skip building the argparse parser
+    if (args := _parse_simple_args(argv)) is None:
+        args = _parse_args(argv)
+    input_path, output_path, pretty = args
+
+    output_path = export_logical_devices(
+        input_path, output_path, indent=2 if pretty else None
+    )
+    print(f"Logical device export written to {output_path}")
+    return 0
+
+
+def _parse_simple_args(argv: list[str]) -> tuple[Path, Path | None, bool] | None:
+    input_path: Path | None = None
+    output_path: Path | None = None
+    pretty = False
+    tokens = iter(argv)
+    for token in tokens:
+        if token == "--pretty":
+            pretty = True
+        elif token in ("-o", "--output") and output_path is None:
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+            output_path = Path(value)
+        elif token.startswith("-") or input_path is not None:
+            return None
+        else:
+            input_path = Path(token)
+    if input_path is None:
+        return None
+    return input_path, output_path, pretty
+
+
+def _parse_args(argv: list[str]) -> tuple[Path, Path | None, bool]:
+    import argparse  # pylint: disable=import-outside-toplevel
+
     parser = argparse.ArgumentParser(
         description=(
             "Create a JSON export grouping logical devices with their linked group addresses"
@@ -236,11 +461,13 @@ def main(argv: list[str] | None = None) -> int:
         type=Path,
         help="Optional output path. Defaults to <input>_logical_devices.json",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON output instead of writing it compact",
+    )
     args = parser.parse_args(argv)
-
-    output_path = export_logical_devices(args.input, args.output)
-    print(f"Logical device export written to {output_path}")
-    return 0
+    return args.input, args.output, args.pretty
 
 
 if __name__ == "__main__":